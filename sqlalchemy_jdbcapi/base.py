@@ -12,6 +12,26 @@ class MixedBinary(TypeDecorator):
         return value
 
 
+# Java errors raised by drivers that do not implement Connection.isValid,
+# drivers may throw their own subclasses of these
+_PING_NOT_SUPPORTED = (
+    "java.lang.AbstractMethodError",
+    "java.sql.SQLFeatureNotSupportedException",
+)
+
+
+def _ping_not_supported(e):
+    try:
+        cls = e.getClass()
+        while cls is not None:
+            if str(cls.getName()) in _PING_NOT_SUPPORTED:
+                return True
+            cls = cls.getSuperclass()
+    except Exception:
+        pass
+    return False
+
+
 class BaseDialect(object):
     jdbc_db_name = None
     jdbc_driver_name = None
@@ -20,6 +40,8 @@ class BaseDialect(object):
     supports_sane_multi_rowcount = False
     supports_unicode_binds = True
     description_encoding = None
+    # seconds passed to java.sql.Connection.isValid() by do_ping
+    ping_timeout = 1
 
     @classmethod
     def dbapi(cls):
@@ -33,5 +55,40 @@ class BaseDialect(object):
         e = str(e)
         return "connection is closed" in e or "cursor is closed" in e
 
+    def connect(self, *cargs, **cparams):
+        # statements from connect_args={"init_sql": [...]} are sent
+        # to the server as one JDBC batch on every new connection
+        init_sql = cparams.pop("init_sql", None)
+        if isinstance(init_sql, str):
+            init_sql = [init_sql]
+        connection = super(BaseDialect, self).connect(*cargs, **cparams)
+        if init_sql:
+            try:
+                statement = connection.jconn.createStatement()
+                try:
+                    for sql in init_sql:
+                        statement.addBatch(sql)
+                    statement.executeBatch()
+                finally:
+                    statement.close()
+            except Exception:
+                connection.close()
+                raise
+        return connection
+
+    def do_ping(self, dbapi_connection):
+        # prefer the driver's protocol level check (JDBC 4
+        # Connection.isValid) over a SQL round-trip
+        try:
+            return bool(dbapi_connection.jconn.isValid(self.ping_timeout))
+        except AttributeError:
+            pass
+        except Exception as e:
+            if not _ping_not_supported(e):
+                # isValid itself failed on a broken connection
+                return False
+        # driver does not implement isValid, fall back to SELECT 1
+        return super(BaseDialect, self).do_ping(dbapi_connection)
+
     def do_rollback(self, dbapi_connection):
         pass
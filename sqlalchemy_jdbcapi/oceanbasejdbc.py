@@ -2,32 +2,35 @@ import re
 from abc import ABC
 from types import ModuleType
 
-import jaydebeapi
 from sqlalchemy import exc, sql
 from sqlalchemy.dialects.oracle.base import OracleDialect
 from sqlalchemy.engine.url import make_url
-
-
-class OceanBaseCursor(jaydebeapi.Cursor):
-    """Defined private Cursor modify the Clob object value return."""
-    def __init__(self, connection, converters):
-        super(OceanBaseCursor, self).__init__(connection, converters)
-        jaydebeapi._unknownSqlTypeConverter = self._unknownSqlTypeConverter
-
-    def _unknownSqlTypeConverter(self, rs, col):
-        value = rs.getObject(col)
-        if str(type(value)) == "<java class 'com.oceanbase.jdbc.Clob'>":
-            string, reader = '', value.getCharacterStream()
-            while True:
-                char = reader.read()
-                if char == -1:
-                    break
-                string += chr(char)
-            value = string
-        return value
-
-
-class OceanBaseJDBCDialect(OracleDialect, ABC):
+from .base import BaseDialect
+
+_OB_VERSION_RE = re.compile(r"OceanBase ([\d.]+\d+)")
+# JPype class of each value seen by the unknown-type converter,
+# mapped to whether it is an OceanBase Clob
+_CLOB_TYPES = {}
+
+
+def _unknown_sql_type_converter(rs, col):
+    """Read OceanBase Clob values as str, other unknown types as-is."""
+    value = rs.getObject(col)
+    value_type = type(value)
+    is_clob = _CLOB_TYPES.get(value_type)
+    if is_clob is None:
+        is_clob = _CLOB_TYPES[value_type] = (
+            str(value_type) == "<java class 'com.oceanbase.jdbc.Clob'>"
+        )
+    if is_clob:
+        # read the whole Clob in one call rather than per character,
+        # some drivers reject getSubString(1, 0) for an empty Clob
+        length = int(value.length())
+        value = str(value.getSubString(1, length)) if length else ""
+    return value
+
+
+class OceanBaseJDBCDialect(BaseDialect, OracleDialect, ABC):
     name = 'oceanbase'
     driver = 'com.alipay.oceanbase.jdbc.Driver'
 
@@ -37,19 +40,21 @@ class OceanBaseJDBCDialect(OracleDialect, ABC):
     supports_unicode_binds = True
     supports_statement_cache = True
     description_encoding = None
+    # plain attribute instead of OracleDialect's version-based property
+    _is_oracle_8 = False
 
     def initialize(self, connection):
         super(OceanBaseJDBCDialect, self).initialize(connection)
 
     @classmethod
     def dbapi(cls):
-        import jaydebeapi
-        jaydebeapi.Cursor = OceanBaseCursor
-        return jaydebeapi
+        return cls.import_dbapi()
 
     @classmethod
     def import_dbapi(cls) -> ModuleType:
-        return __import__("jaydebeapi")
+        import jaydebeapi
+        jaydebeapi._unknownSqlTypeConverter = _unknown_sql_type_converter
+        return jaydebeapi
 
     def do_rollback(self, connection):
         pass
@@ -58,17 +63,28 @@ class OceanBaseJDBCDialect(OracleDialect, ABC):
         url = make_url(url)
         jdbc_url = f"jdbc:{self.name}://{url.host}:{url.port}/{url.database}"
 
+        # query parameters are passed through as JDBC connection
+        # properties, e.g. ?defaultFetchSize=500
+        driver_args = {}
+        for key, value in url.query.items():
+            if isinstance(value, tuple):
+                raise exc.ArgumentError(
+                    f"JDBC connection property {key!r} is given more "
+                    "than once in the URL query string"
+                )
+            driver_args[key] = value
+        if url.username is not None:
+            driver_args["user"] = url.username
+        if url.password is not None:
+            driver_args["password"] = url.password
+
         kwargs = {
             "jclassname": self.driver,
             "url": jdbc_url,
-            "driver_args": [url.username, url.password]
+            "driver_args": driver_args
         }
         return (), kwargs
 
-    @property
-    def _is_oracle_8(self):
-        return False
-
     def _check_max_identifier_length(self, connection):
         return None
 
@@ -76,7 +92,7 @@ class OceanBaseJDBCDialect(OracleDialect, ABC):
         try:
             ver_sql = sql.text("SELECT BANNER FROM v$version")
             banner = connection.execute(ver_sql).scalar()
-            version = re.search("OceanBase ([\\d+\\.]+\\d+)", banner).group(1)
-            return tuple(int(x) for x in version.split("."))
+            version = _OB_VERSION_RE.search(banner).group(1)
+            return tuple(map(int, version.split(".")))
         except exc.DBAPIError:
             return None
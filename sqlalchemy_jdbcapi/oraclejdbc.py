@@ -8,6 +8,8 @@ from sqlalchemy.sql import sqltypes
 from sqlalchemy import util, exc
 from .base import MixedBinary, BaseDialect
 
+_ORACLE_VERSION_RE = re.compile(r"Release ([\d.]+)")
+
 colspecs = util.update_copy(
     OracleDialect.colspecs, {sqltypes.LargeBinary: MixedBinary,},
 )
@@ -48,15 +50,29 @@ class OracleJDBCDialect(BaseDialect, OracleDialect):
         return ((), kwargs)
 
     def _get_server_version_info(self, connection):
-
+        # the driver already holds the banner from the handshake,
+        # only query v$version if it can't be read from the metadata
         try:
-            banner = connection.execute(
-                "SELECT BANNER FROM v$version"
-            ).scalar()
-        except exc.DBAPIError:
+            banner = str(
+                connection.connection.jconn.getMetaData()
+                .getDatabaseProductVersion()
+            )
+        except Exception:
             banner = None
-        version = re.search(r"Release ([\d\.]+)", banner).group(1)
-        return tuple(int(x) for x in version.split("."))
+        match = banner and _ORACLE_VERSION_RE.search(banner)
+        if not match:
+            try:
+                banner = connection.exec_driver_sql(
+                    "SELECT BANNER FROM v$version"
+                ).scalar()
+            except exc.DBAPIError:
+                banner = None
+            match = banner and _ORACLE_VERSION_RE.search(banner)
+            if not match:
+                raise AssertionError(
+                    "Could not determine version from banner %r" % banner
+                )
+        return tuple(map(int, match.group(1).split(".")))
 
 
 dialect = OracleJDBCDialect
@@ -1,6 +1,8 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import re
+import sys
 from collections import defaultdict
 from sqlalchemy.dialects.postgresql.base import PGDialect
 from sqlalchemy.sql import sqltypes
@@ -9,6 +11,10 @@ from sqlalchemy.engine import reflection
 from .base import BaseDialect, MixedBinary
 
 
+# same groups as PGDialect._get_server_version_info, so both give
+# (9, 6, 3) for 9.x servers and (13, 4) for 10+
+_PG_VERSION_RE = re.compile(r"(\d+)\.?(\d+)?(?:\.(\d+))?")
+
 colspecs = util.update_copy(
     PGDialect.colspecs, {sqltypes.LargeBinary: MixedBinary,},
 )
@@ -45,6 +51,24 @@ class PGJDBCDialect(BaseDialect, PGDialect):
         }
         return ((), kwargs)
 
+    def _get_server_version_info(self, connection):
+        # read the server_version the driver got from the handshake
+        # (e.g. "9.6.3" or "13.4 (Debian ...)") instead of running
+        # "select pg_catalog.version()"
+        try:
+            version = str(
+                connection.connection.jconn.getMetaData()
+                .getDatabaseProductVersion()
+            )
+        except Exception:
+            version = ""
+        m = _PG_VERSION_RE.match(version)
+        if m is None:
+            return super(PGJDBCDialect, self)._get_server_version_info(
+                connection
+            )
+        return tuple(int(x) for x in m.group(1, 2, 3) if x is not None)
+
     @reflection.cache
     def get_unique_constraints(
         self, connection, table_name, schema=None, **kw
@@ -70,7 +94,7 @@ class PGJDBCDialect(BaseDialect, PGDialect):
         """
 
         t = sql.text(UNIQUE_SQL).columns(col_name=sqltypes.Unicode)
-        c = connection.execute(t, table_oid=table_oid)
+        c = connection.execute(t, {"table_oid": table_oid})
 
         uniques = defaultdict(lambda: defaultdict(dict))
         for row in c.fetchall():
@@ -78,7 +102,12 @@ class PGJDBCDialect(BaseDialect, PGDialect):
             uc["key"] = (
                 row.key.getArray() if hasattr(row.key, "getArray") else row.key
             )
-            uc["cols"][row.col_num] = row.col_name
+            col_name = row.col_name
+            # without JPype string conversion this is a java.lang.String,
+            # which sys.intern() does not accept
+            if type(col_name) is str:
+                col_name = sys.intern(col_name)
+            uc["cols"][row.col_num] = col_name
 
         return [
             {"name": name, "column_names": [uc["cols"][i] for i in uc["key"]]}
@@ -0,0 +1,149 @@
+from unittest import mock
+
+import pytest
+from sqlalchemy.engine.default import DefaultDialect
+
+from sqlalchemy_jdbcapi.base import BaseDialect
+
+
+class Dialect(BaseDialect, DefaultDialect):
+    pass
+
+
+class JavaClass(object):
+    def __init__(self, name, superclass=None):
+        self.name = name
+        self.superclass = superclass
+
+    def getName(self):
+        return self.name
+
+    def getSuperclass(self):
+        return self.superclass
+
+
+class JavaError(Exception):
+    def __init__(self, java_class):
+        if isinstance(java_class, str):
+            java_class = JavaClass(java_class)
+        super(JavaError, self).__init__(java_class.name)
+        self.java_class = java_class
+
+    def getClass(self):
+        return self.java_class
+
+
+def test_do_ping_uses_is_valid():
+    conn = mock.Mock()
+    conn.jconn.isValid.return_value = True
+
+    assert Dialect().do_ping(conn) is True
+    conn.jconn.isValid.assert_called_once_with(1)
+    conn.cursor.assert_not_called()
+
+
+def test_do_ping_is_valid_false():
+    conn = mock.Mock()
+    conn.jconn.isValid.return_value = False
+
+    assert Dialect().do_ping(conn) is False
+    conn.cursor.assert_not_called()
+
+
+@pytest.mark.parametrize(
+    "class_name",
+    [
+        "java.lang.AbstractMethodError",
+        "java.sql.SQLFeatureNotSupportedException",
+    ],
+)
+def test_do_ping_falls_back_when_unsupported(class_name):
+    conn = mock.Mock()
+    conn.jconn.isValid.side_effect = JavaError(class_name)
+
+    assert Dialect().do_ping(conn) is True
+    cursor = conn.cursor.return_value
+    cursor.execute.assert_called_once()
+    cursor.close.assert_called_once_with()
+
+
+def test_do_ping_falls_back_for_vendor_subclass():
+    # e.g. DB2 jcc's SqlFeatureNotSupportedException
+    java_class = JavaClass(
+        "com.ibm.db2.jcc.am.SqlFeatureNotSupportedException",
+        JavaClass(
+            "java.sql.SQLFeatureNotSupportedException",
+            JavaClass("java.sql.SQLException"),
+        ),
+    )
+    conn = mock.Mock()
+    conn.jconn.isValid.side_effect = JavaError(java_class)
+
+    assert Dialect().do_ping(conn) is True
+    conn.cursor.return_value.execute.assert_called_once()
+
+
+def test_do_ping_broken_connection():
+    conn = mock.Mock()
+    conn.jconn.isValid.side_effect = JavaError("java.sql.SQLException")
+
+    assert Dialect().do_ping(conn) is False
+    conn.cursor.assert_not_called()
+
+
+def _connect(dialect, dbapi_connection, **cparams):
+    with mock.patch.object(
+        DefaultDialect, "connect", return_value=dbapi_connection
+    ) as connect:
+        result = dialect.connect("url", **cparams)
+    return connect, result
+
+
+def test_connect_runs_init_sql_as_batch():
+    conn = mock.Mock()
+    statement = conn.jconn.createStatement.return_value
+
+    connect, result = _connect(
+        Dialect(), conn, init_sql=["SET a = 1", "SET b = 2"], x=1
+    )
+
+    assert result is conn
+    connect.assert_called_once_with("url", x=1)
+    assert statement.addBatch.call_args_list == [
+        mock.call("SET a = 1"),
+        mock.call("SET b = 2"),
+    ]
+    statement.executeBatch.assert_called_once_with()
+    statement.close.assert_called_once_with()
+    conn.close.assert_not_called()
+
+
+def test_connect_init_sql_string():
+    conn = mock.Mock()
+    statement = conn.jconn.createStatement.return_value
+
+    _connect(Dialect(), conn, init_sql="SET a = 1")
+
+    statement.addBatch.assert_called_once_with("SET a = 1")
+
+
+def test_connect_without_init_sql():
+    conn = mock.Mock()
+
+    connect, result = _connect(Dialect(), conn)
+
+    assert result is conn
+    connect.assert_called_once_with("url")
+    conn.jconn.createStatement.assert_not_called()
+
+
+def test_connect_closes_connection_on_init_sql_failure():
+    conn = mock.Mock()
+    statement = conn.jconn.createStatement.return_value
+    statement.executeBatch.side_effect = RuntimeError("bad sql")
+
+    with pytest.raises(RuntimeError):
+        _connect(Dialect(), conn, init_sql=["SET a = 1"])
+
+    statement.close.assert_called_once_with()
+    conn.close.assert_called_once_with()
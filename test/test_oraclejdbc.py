@@ -0,0 +1,55 @@
+from unittest import mock
+
+import pytest
+
+from sqlalchemy_jdbcapi.oraclejdbc import OracleJDBCDialect
+
+
+def _connection(product_version):
+    connection = mock.Mock()
+    meta = connection.connection.jconn.getMetaData.return_value
+    meta.getDatabaseProductVersion.return_value = product_version
+    return connection
+
+
+def test_server_version_from_metadata():
+    connection = _connection(
+        "Oracle Database 19c Enterprise Edition Release 19.0.0.0.0 - "
+        "Production\nVersion 19.3.0.0.0"
+    )
+
+    assert OracleJDBCDialect()._get_server_version_info(connection) == (
+        19,
+        0,
+        0,
+        0,
+        0,
+    )
+    connection.exec_driver_sql.assert_not_called()
+
+
+def test_server_version_falls_back_to_query():
+    connection = _connection("unknown")
+    connection.exec_driver_sql.return_value.scalar.return_value = (
+        "Oracle Database 11g Express Edition Release 11.2.0.2.0 - 64bit "
+        "Production"
+    )
+
+    assert OracleJDBCDialect()._get_server_version_info(connection) == (
+        11,
+        2,
+        0,
+        2,
+        0,
+    )
+    connection.exec_driver_sql.assert_called_once_with(
+        "SELECT BANNER FROM v$version"
+    )
+
+
+def test_server_version_unknown_banner():
+    connection = _connection("unknown")
+    connection.exec_driver_sql.return_value.scalar.return_value = None
+
+    with pytest.raises(AssertionError, match="Could not determine version"):
+        OracleJDBCDialect()._get_server_version_info(connection)
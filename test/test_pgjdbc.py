@@ -0,0 +1,58 @@
+import sys
+from types import SimpleNamespace
+from unittest import mock
+
+import pytest
+
+from sqlalchemy_jdbcapi.pgjdbc import PGJDBCDialect
+
+
+def _connection(product_version):
+    connection = mock.Mock()
+    meta = connection.connection.jconn.getMetaData.return_value
+    meta.getDatabaseProductVersion.return_value = product_version
+    return connection
+
+
+@pytest.mark.parametrize(
+    "product_version, expected",
+    [
+        ("9.6.3", (9, 6, 3)),
+        ("13.4 (Debian 13.4-1.pgdg100+1)", (13, 4)),
+        ("16beta1", (16,)),
+    ],
+)
+def test_server_version_from_metadata(product_version, expected):
+    connection = _connection(product_version)
+
+    assert PGJDBCDialect()._get_server_version_info(connection) == expected
+    connection.exec_driver_sql.assert_not_called()
+
+
+def test_server_version_falls_back_to_query():
+    connection = _connection("unknown")
+    connection.exec_driver_sql.return_value.scalar.return_value = (
+        "PostgreSQL 9.6.3 on x86_64-pc-linux-gnu"
+    )
+
+    assert PGJDBCDialect()._get_server_version_info(connection) == (9, 6, 3)
+
+
+def test_get_unique_constraints():
+    connection = mock.Mock()
+    connection.execute.return_value.fetchall.return_value = [
+        SimpleNamespace(name="uq_ab", key=[2, 1], col_num=1, col_name="a"),
+        SimpleNamespace(name="uq_ab", key=[2, 1], col_num=2, col_name="b"),
+        SimpleNamespace(name="uq_c", key=[3], col_num=3, col_name="c"),
+    ]
+    dialect = PGJDBCDialect()
+
+    with mock.patch.object(dialect, "get_table_oid", return_value=1234):
+        uniques = dialect.get_unique_constraints(connection, "t")
+
+    assert uniques == [
+        {"name": "uq_ab", "column_names": ["b", "a"]},
+        {"name": "uq_c", "column_names": ["c"]},
+    ]
+    assert uniques[0]["column_names"][0] is sys.intern("b")
+    assert connection.execute.call_args[0][1] == {"table_oid": 1234}